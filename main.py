@@ -2,8 +2,8 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
-#     "tomli",
-#     "httpx",
+#     "httpx[http2]",
+#     "orjson",
 #     "rich",
 # ]
 # ///
@@ -15,82 +15,124 @@ and wins for continuous improvement. Also generates daily work logs.
 """
 
 import argparse
+import asyncio
+import atexit
+import calendar
+import fnmatch
+import functools
+import hashlib
+import io
+import itertools
 import json
 import os
+import pickle
+import queue
+import random
 import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
+import tomllib
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import httpx
 import sqlite3
-import tomli
 import uuid
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+_http_client = None
+_http_client_lock = threading.Lock()
+
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "cass" / "daily-report.toml"
 DEFAULT_OUTPUT_DIR = Path.home() / "Documents" / "docs" / "cass-reports"
 DEFAULT_PROMPT_PATH = Path.home() / ".config" / "cass" / "daily-report-prompt.md"
 DEFAULT_CASS_PATH = "cass"
 
-PREDEFINED_CATEGORIES = [
+CASS_SEARCH_TIMEOUT = 60
+CASS_HELP_TIMEOUT = 10
+CASS_HEALTH_TIMEOUT = 30
+CASS_SYNC_TIMEOUT = 300
+CASS_INDEX_TIMEOUT = 300
+LLM_TIMEOUT = 120
+CONVEX_TIMEOUT = 30.0
+CONVEX_MAX_PARALLEL = 8
+CONVEX_MAX_ATTEMPTS = 3
+
+LLM_SHARD_SIZE = 20
+LLM_HIT_CONTENT_CHARS = 500
+MAX_SESSION_LINKS_PER_CATEGORY = 100
+DOC_STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+_FENCE_RE = re.compile(r'^```(?:json)?\s*\n(.*?)\n```\s*$', re.DOTALL)
+_FILE_MENTION_RE = re.compile(r'(?:wrote|created|modified|edited|read)\s+[`"]?([^\s`"]+\.\w+)[`"]?', re.IGNORECASE)
+_BATCH_FLAG_RE = re.compile(r"(?<![\w-])--batch(?![\w-])")
+
+PREDEFINED_CATEGORIES = (
     {
         "name": "testing_gaps",
         "display": "Testing Gaps",
-        "queries": ["claim to test", "should work", "looks correct", "assuming it works"],
+        "queries": ("claim to test", "should work", "looks correct", "assuming it works"),
         "description": "Agents claiming to test without actually running tests",
     },
     {
         "name": "unused_artifacts",
         "display": "Unused Artifacts",
-        "queries": ["screenshot", "captured", "saved image"],
+        "queries": ("screenshot", "captured", "saved image"),
         "description": "Screenshots or files created but never analyzed",
     },
     {
         "name": "debug_pollution",
         "display": "Debug Pollution",
-        "queries": ["console.log", "println!", "dbg!", "print(", "debugger"],
+        "queries": ("console.log", "println!", "dbg!", "print(", "debugger"),
         "description": "Debug logging left in production code",
     },
     {
         "name": "state_management",
         "display": "State Management",
-        "queries": ["notify", "setState", "signal", "emit"],
+        "queries": ("notify", "setState", "signal", "emit"),
         "description": "Missing state update notifications after mutations",
     },
     {
         "name": "naming_inconsistencies",
         "display": "Naming Inconsistencies",
-        "queries": ["wrong key", "typo", "mismatch", "incorrect name"],
+        "queries": ("wrong key", "typo", "mismatch", "incorrect name"),
         "description": "Key name mismatches and identifier typos",
     },
     {
         "name": "process_skips",
         "display": "Process Skips",
-        "queries": ["skip verification", "without checking", "bypass", "skip test"],
+        "queries": ("skip verification", "without checking", "bypass", "skip test"),
         "description": "Verification steps bypassed before commits",
     },
     {
         "name": "error_handling",
         "display": "Error Handling",
-        "queries": ["uncaught", "unhandled", "missing try", "bare unwrap", "panic"],
+        "queries": ("uncaught", "unhandled", "missing try", "bare unwrap", "panic"),
         "description": "Missing or inadequate error handling",
     },
     {
         "name": "todo_accumulation",
         "display": "TODO Accumulation",
-        "queries": ["TODO", "FIXME", "HACK", "XXX"],
+        "queries": ("TODO", "FIXME", "HACK", "XXX"),
         "description": "Technical debt markers not addressed",
     },
-]
+)
 
 DEFAULT_PROMPT_TEMPLATE = """You are analyzing coding agent session data from CASS (Coding Agent Session Search).
 
@@ -113,7 +155,7 @@ Respond with ONLY valid JSON (no markdown, no explanation):
       "description": "Brief description of the issue",
       "severity": "high|medium|low",
       "occurrences": 3,
-      "example_sessions": ["path/to/session.jsonl:42"],
+      "example_sessions": [["path/to/session.jsonl", 42]],
       "recommendation": "How to improve"
     }}
   ],
@@ -121,7 +163,7 @@ Respond with ONLY valid JSON (no markdown, no explanation):
     {{
       "description": "Brief description of good practice",
       "occurrences": 5,
-      "example_sessions": ["path/to/session.jsonl:100"]
+      "example_sessions": [["path/to/session.jsonl", 100]]
     }}
   ],
   "summary": "One sentence summary of findings for this category"
@@ -136,6 +178,7 @@ class Config:
     log_level: str = "info"
     max_parallel: int = 3
     cass_path: str = DEFAULT_CASS_PATH
+    cass_url: str = ""
     scope: str = "since_last_run"
     agents: list[str] = field(default_factory=list)
     workspace_include: list[str] = field(default_factory=list)
@@ -161,8 +204,12 @@ class Config:
             return cls()
         
         with open(path, "rb") as f:
-            data = tomli.load(f)
+            data = tomllib.load(f)
         
+        return cls.from_dict(data)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
         config = cls()
         
         if "general" in data:
@@ -175,6 +222,8 @@ class Config:
                 config.log_level = g["log_level"]
             if "cass_path" in g:
                 config.cass_path = g["cass_path"]
+            if "cass_url" in g:
+                config.cass_url = g["cass_url"]
         
         if "queries" in data:
             q = data["queries"]
@@ -236,6 +285,28 @@ class Config:
         return config
 
 
+def load_pickle_cache(cache_path: Path, cache_key: tuple):
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, value = pickle.load(f)
+    except Exception:
+        return None
+    return value if cached_key == cache_key else None
+
+
+def save_pickle_cache(cache_path: Path, cache_key: tuple, value) -> None:
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((cache_key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 @dataclass
 class CategoryResult:
     name: str
@@ -254,7 +325,7 @@ class ProjectWork:
     name: str
     workspace: str
     sessions: list[dict]
-    files_modified: set[str]
+    files_modified: dict[str, None]
     start_time: datetime | None = None
     end_time: datetime | None = None
     accomplishments: list[str] = field(default_factory=list)
@@ -272,14 +343,144 @@ class WorkLog:
     total_estimated_minutes: int
 
 
-def run_command(cmd: list[str], input_text: str | None = None) -> tuple[int, str, str]:
-    result = subprocess.run(
-        cmd,
-        input=input_text,
-        capture_output=True,
+@dataclass(slots=True)
+class ActivityRecord:
+    timestamp: int
+    date: str
+    source_id: str
+    project: str | None
+    workspace: str | None
+    session_path: str | None
+    line_number: int | None
+    agent: str | None
+    title: str | None
+    type: str = "session_message"
+    source: str = "cass"
+    
+    def payload(self) -> dict:
+        return {
+            "sessionPath": self.session_path,
+            "lineNumber": self.line_number,
+            "agent": self.agent,
+            "workspace": self.workspace,
+            "title": self.title,
+        }
+    
+    def to_convex(self) -> dict:
+        return {
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "date": self.date,
+            "source": self.source,
+            "sourceId": self.source_id,
+            "project": self.project,
+            "workspace": self.workspace,
+            "isPublic": False,
+            "payload": self.payload(),
+        }
+
+
+@dataclass
+class ScanEntry:
+    path: str
+    name: str
+    mtime: datetime
+    ctime: datetime
+    size: int = 0
+    
+    def iter_lines(self) -> Iterator[str]:
+        try:
+            with open(self.path, encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    yield line.rstrip("\n")
+        except (OSError, UnicodeDecodeError):
+            return
+    
+    @functools.cached_property
+    def text(self) -> str:
+        try:
+            with open(self.path, encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return ""
+    
+    @functools.cached_property
+    def lowered(self) -> str:
+        return self.text.lower()
+    
+    @functools.cached_property
+    def lines(self) -> list[str]:
+        return self.text.split("\n")
+    
+    @functools.cached_property
+    def lowered_lines(self) -> list[str]:
+        return self.lowered.split("\n")
+
+
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumpb(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    return json_dumpb(obj, indent).decode()
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    return shutil.which(name) or name
+
+
+def spawn_command(cmd: list[str]) -> list[str]:
+    return [resolve_executable(cmd[0]), *cmd[1:]]
+
+
+def run_command(
+    cmd: list[str],
+    input_text: str | None = None,
+    timeout: float | None = None,
+) -> tuple[int, str, str]:
+    proc = subprocess.Popen(
+        spawn_command(cmd),
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
+        close_fds=False,
+    )
+    try:
+        stdout, stderr = proc.communicate(input_text, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return 124, "", f"timed out after {timeout}s"
+    return proc.returncode, stdout, stderr
+
+
+def run_command_bytes(cmd: list[str], timeout: float | None = None) -> tuple[int, bytes, str]:
+    proc = subprocess.Popen(
+        spawn_command(cmd),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
     )
-    return result.returncode, result.stdout, result.stderr
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return 124, b"", f"timed out after {timeout}s"
+    return proc.returncode, stdout, stderr.decode(errors="replace")
 
 
 def get_last_run_timestamp(output_dir: Path) -> datetime | None:
@@ -299,11 +500,11 @@ def set_last_run_timestamp(output_dir: Path, ts: datetime) -> None:
 
 
 def check_cass_health(cass_path: str = "cass") -> tuple[bool, dict]:
-    code, stdout, _ = run_command([cass_path, "health", "--json"])
+    code, stdout, _ = run_command([cass_path, "health", "--json"], timeout=CASS_HEALTH_TIMEOUT)
     if code != 0:
         return False, {}
     try:
-        data = json.loads(stdout)
+        data = json_loads(stdout)
         return data.get("healthy", False), data
     except json.JSONDecodeError:
         return False, {}
@@ -311,21 +512,53 @@ def check_cass_health(cass_path: str = "cass") -> tuple[bool, dict]:
 
 def sync_remote_sources(sources: list[str], cass_path: str = "cass") -> bool:
     if not sources:
-        code, _, _ = run_command([cass_path, "sources", "sync", "--json"])
+        code, _, _ = run_command([cass_path, "sources", "sync", "--json"], timeout=CASS_SYNC_TIMEOUT)
         return code == 0
     else:
         for source in sources:
-            code, _, _ = run_command([cass_path, "sources", "sync", "--source", source, "--json"])
+            code, _, _ = run_command(
+                [cass_path, "sources", "sync", "--source", source, "--json"],
+                timeout=CASS_SYNC_TIMEOUT,
+            )
             if code != 0:
                 return False
         return True
 
 
 def run_cass_index(cass_path: str = "cass") -> bool:
-    code, _, _ = run_command([cass_path, "index", "--json"])
+    code, _, _ = run_command([cass_path, "index", "--json"], timeout=CASS_INDEX_TIMEOUT)
     return code == 0
 
 
+@functools.lru_cache(maxsize=32)
+def _cass_filter_suffix(
+    since_str: str | None,
+    agents: tuple[str, ...],
+    workspace_include: tuple[str, ...],
+) -> tuple[str, ...]:
+    args = []
+    
+    if since_str:
+        args.extend(["--since", since_str])
+    
+    for agent in agents:
+        args.extend(["--agent", agent])
+    
+    for ws in workspace_include:
+        args.extend(["--workspace", ws])
+    
+    return tuple(args)
+
+
+def cass_filter_args(
+    since: datetime | None,
+    agents: list[str],
+    workspace_include: list[str],
+) -> tuple[str, ...]:
+    since_str = since.strftime("%Y-%m-%dT%H:%M:%S") if since else None
+    return _cass_filter_suffix(since_str, tuple(agents), tuple(workspace_include))
+
+
 def build_cass_query(
     query: str,
     since: datetime | None,
@@ -334,18 +567,265 @@ def build_cass_query(
     cass_path: str = "cass",
     limit: int = 50,
 ) -> list[str]:
-    cmd = [cass_path, "search", query, "--robot", "--limit", str(limit)]
+    return [
+        cass_path, "search", query, "--robot", "--limit", str(limit),
+        *cass_filter_args(since, agents, workspace_include),
+    ]
+
+
+def build_cass_batch_query(
+    since: datetime | None,
+    agents: list[str],
+    workspace_include: list[str],
+    cass_path: str = "cass",
+    limit: int = 50,
+) -> list[str]:
+    return [
+        cass_path, "search", "--batch", "--robot", "--limit", str(limit),
+        *cass_filter_args(since, agents, workspace_include),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def cass_supports_batch(cass_path: str) -> bool:
+    code, stdout, stderr = run_command([cass_path, "search", "--help"], timeout=CASS_HELP_TIMEOUT)
+    return code == 0 and _BATCH_FLAG_RE.search(stdout + stderr) is not None
+
+
+def parse_cass_output(stdout: bytes) -> dict | None:
+    if not stdout.strip():
+        return None
+    try:
+        data = json_loads(stdout)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class CassBatch:
+    def __init__(self, cmd: list[str]):
+        self.cmd = cmd
+        self.proc: subprocess.Popen | None = None
     
+    def __enter__(self) -> "CassBatch":
+        self.proc = subprocess.Popen(
+            spawn_command(self.cmd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        self.lines: queue.Queue[bytes] = queue.Queue()
+        threading.Thread(target=self._read_lines, daemon=True).start()
+        return self
+    
+    def _read_lines(self) -> None:
+        for line in self.proc.stdout:
+            self.lines.put(line)
+        self.lines.put(b"")
+    
+    def _kill(self) -> None:
+        self.proc.kill()
+        self.proc.wait()
+    
+    def search(self, query: str) -> dict | None:
+        if self.proc is None or self.proc.poll() is not None:
+            return None
+        try:
+            self.proc.stdin.write(query.encode() + b"\n")
+            self.proc.stdin.flush()
+            data = parse_cass_output(self.lines.get(timeout=CASS_SEARCH_TIMEOUT))
+        except (OSError, queue.Empty):
+            data = None
+        if data is None:
+            self._kill()
+        return data
+    
+    def __exit__(self, *exc) -> None:
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=CASS_SEARCH_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill()
+
+
+def cass_http_search(
+    query: str,
+    since: datetime | None,
+    config: Config,
+    limit: int = 50,
+) -> bytes | None:
+    import httpx
+    
+    params = {"q": query, "limit": limit}
     if since:
-        cmd.extend(["--since", since.strftime("%Y-%m-%dT%H:%M:%S")])
+        params["since"] = since.strftime("%Y-%m-%dT%H:%M:%S")
+    if config.agents:
+        params["agent"] = config.agents
+    if config.workspace_include:
+        params["workspace"] = config.workspace_include
     
-    for agent in agents:
-        cmd.extend(["--agent", agent])
+    try:
+        response = get_http_client().get(
+            f"{config.cass_url.rstrip('/')}/search",
+            params=params,
+            timeout=CASS_SEARCH_TIMEOUT,
+        )
+    except httpx.TransportError:
+        return None
+    return response.content if response.status_code == 200 else b""
+
+
+def run_cass_queries(
+    queries: Sequence[str],
+    since: datetime | None,
+    config: Config,
+) -> list[dict | None]:
+    def run_one(query: str) -> dict | None:
+        if config.cass_url:
+            stdout = cass_http_search(query, since, config)
+            if stdout is not None:
+                return parse_cass_output(stdout)
+        
+        cmd = build_cass_query(
+            query,
+            since,
+            config.agents,
+            config.workspace_include,
+            config.cass_path,
+        )
+        code, stdout, _ = run_command_bytes(cmd, timeout=CASS_SEARCH_TIMEOUT)
+        return parse_cass_output(stdout) if code == 0 else None
+    
+    if len(queries) < 2:
+        return [run_one(query) for query in queries]
+    
+    if config.cass_url or not cass_supports_batch(config.cass_path):
+        with ThreadPoolExecutor(max_workers=min(len(queries), config.max_parallel)) as executor:
+            return list(executor.map(run_one, queries))
+    
+    cmd = build_cass_batch_query(since, config.agents, config.workspace_include, config.cass_path)
+    outputs = []
+    with CassBatch(cmd) as batch:
+        for query in queries:
+            output = batch.search(query)
+            if output is None:
+                break
+            outputs.append(output)
+    
+    remaining = queries[len(outputs):]
+    if remaining:
+        with ThreadPoolExecutor(max_workers=min(len(remaining), config.max_parallel)) as executor:
+            outputs.extend(executor.map(run_one, remaining))
+    return outputs
+
+
+@functools.lru_cache(maxsize=8)
+def compile_doc_patterns(patterns: tuple[str, ...]) -> re.Pattern | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?P<p{i}>{fnmatch.translate(pattern)})" for i, pattern in enumerate(patterns)
+    ))
+
+
+def iter_doc_files(dir_path: Path, patterns: tuple[str, ...]) -> Iterator[tuple[str, str, os.stat_result]]:
+    name_patterns = tuple(p for p in patterns if "/" not in p and os.sep not in p)
+    path_patterns = [p for p in patterns if p not in name_patterns]
+    
+    pattern_re = compile_doc_patterns(name_patterns)
+    if pattern_re is not None:
+        buckets: list[list[os.DirEntry]] = [[] for _ in name_patterns]
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    match = pattern_re.match(entry.name)
+                    if match:
+                        buckets[int(match.lastgroup[1:])].append(entry)
+        except OSError:
+            pass
+        
+        for entry in itertools.chain.from_iterable(buckets):
+            try:
+                if entry.is_file():
+                    yield entry.path, entry.name, entry.stat()
+            except OSError:
+                continue
     
-    for ws in workspace_include:
-        cmd.extend(["--workspace", ws])
+    for pattern in path_patterns:
+        for file_path in dir_path.glob(pattern):
+            try:
+                if file_path.is_file():
+                    yield str(file_path), file_path.name, file_path.stat()
+            except OSError:
+                continue
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_docs_once(extra_dirs: tuple[Path, ...], patterns: tuple[str, ...]) -> tuple[ScanEntry, ...]:
+    entries = []
+    by_path: dict[str, ScanEntry] = {}
+    
+    for dir_path in extra_dirs:
+        for path, name, st in iter_doc_files(dir_path, patterns):
+            entry = by_path.get(path)
+            if entry is None:
+                entry = by_path[path] = ScanEntry(
+                    path=path,
+                    name=name,
+                    mtime=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+                    ctime=datetime.fromtimestamp(st.st_ctime, tz=timezone.utc),
+                    size=st.st_size,
+                )
+            entries.append(entry)
     
-    return cmd
+    return tuple(entries)
+
+
+def search_extra_dirs_multi(
+    queries: Sequence[str],
+    extra_dirs: list[Path],
+    patterns: list[str],
+    since: datetime | None,
+) -> dict[str, list[dict]]:
+    hits: dict[str, list[dict]] = {query: [] for query in queries}
+    lowered_queries = [(query.lower(), query) for query in hits]
+    
+    for entry in _scan_docs_once(tuple(extra_dirs), tuple(patterns)):
+        if since and entry.mtime < since:
+            continue
+        
+        if entry.size > DOC_STREAM_THRESHOLD_BYTES:
+            file_queries = lowered_queries
+            line_pairs = ((line, line.lower()) for line in entry.iter_lines())
+        else:
+            file_queries = [
+                (query_lower, query) for query_lower, query in lowered_queries
+                if query_lower in entry.lowered
+            ]
+            if not file_queries:
+                continue
+            line_pairs = zip(entry.lines, entry.lowered_lines)
+        
+        file_hits: dict[str, list[dict]] = {query: [] for _, query in file_queries}
+        
+        for i, (line, line_lower) in enumerate(line_pairs, 1):
+            for query_lower, query in file_queries:
+                if query_lower in line_lower:
+                    file_hits[query].append({
+                        "source": "docs",
+                        "source_path": entry.path,
+                        "line_number": i,
+                        "content": line.strip()[:200],
+                        "query": query,
+                    })
+        
+        for query, query_hits in file_hits.items():
+            hits[query].extend(query_hits)
+    
+    return hits
 
 
 def search_extra_dirs(
@@ -354,40 +834,61 @@ def search_extra_dirs(
     patterns: list[str],
     since: datetime | None,
 ) -> list[dict]:
-    hits = []
-    query_lower = query.lower()
+    return search_extra_dirs_multi([query], extra_dirs, patterns, since)[query]
+
+
+def intern_hit_fields(hits: list[dict]) -> list[dict]:
+    for hit in hits:
+        for key in ("workspace", "agent"):
+            value = hit.get(key)
+            if isinstance(value, str):
+                hit[key] = sys.intern(value)
+    return hits
+
+
+def collect_cass_hits(cass_outputs: list[dict | None], config: Config) -> list[dict]:
+    raw_cass_hits = []
     
-    for dir_path in extra_dirs:
-        if not dir_path.exists():
+    exclude_re = (
+        re.compile("|".join(map(re.escape, config.workspace_exclude)))
+        if config.workspace_exclude
+        else None
+    )
+    
+    for data in cass_outputs:
+        if data is None:
             continue
-        
-        for pattern in patterns:
-            for file_path in dir_path.glob(pattern):
-                if not file_path.is_file():
-                    continue
-                
-                if since:
-                    mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
-                    if mtime < since:
-                        continue
-                
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    lines = content.split("\n")
-                    
-                    for i, line in enumerate(lines, 1):
-                        if query_lower in line.lower():
-                            hits.append({
-                                "source": "docs",
-                                "source_path": str(file_path),
-                                "line_number": i,
-                                "content": line.strip()[:200],
-                                "query": query,
-                            })
-                except (OSError, UnicodeDecodeError):
-                    pass
+        hits = data.get("hits", [])
+        if exclude_re:
+            hits = [hit for hit in hits if not exclude_re.search(hit.get("workspace") or "")]
+        raw_cass_hits.extend(hits)
     
-    return hits
+    deduped_cass_hits: dict[tuple, dict] = {}
+    for hit in raw_cass_hits:
+        deduped_cass_hits.setdefault((hit.get("source_path"), hit.get("line_number", 0)), hit)
+    return list(deduped_cass_hits.values())
+
+
+def collect_doc_hits(
+    queries: Sequence[str],
+    since: datetime | None,
+    config: Config,
+) -> list[dict]:
+    all_doc_hits = []
+    seen_doc_paths = set()
+    
+    if not config.extra_dirs:
+        return all_doc_hits
+    
+    hits_by_query = search_extra_dirs_multi(queries, config.extra_dirs, config.extra_patterns, since)
+    for doc_hits in hits_by_query.values():
+        for hit in doc_hits:
+            path_key = (hit["source_path"], hit["line_number"])
+            if path_key not in seen_doc_paths:
+                seen_doc_paths.add(path_key)
+                all_doc_hits.append(hit)
+    
+    return all_doc_hits
 
 
 def search_category(
@@ -396,54 +897,248 @@ def search_category(
     config: Config,
 ) -> CategoryResult:
     name = category["name"]
-    display = category.get("display", name)
-    description = category.get("description", "")
     queries = category.get("queries", [])
     
-    all_cass_hits = []
-    all_doc_hits = []
-    seen_cass_paths = set()
-    seen_doc_paths = set()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        doc_future = executor.submit(collect_doc_hits, queries, since, config)
+        cass_outputs = run_cass_queries(queries, since, config)
+        doc_hits = doc_future.result()
     
-    for query in queries:
-        cmd = build_cass_query(
-            query,
-            since,
-            config.agents,
-            config.workspace_include,
-            config.cass_path,
-        )
-        code, stdout, _ = run_command(cmd)
+    return CategoryResult(
+        name=name,
+        display=category.get("display", name),
+        description=category.get("description", ""),
+        cass_hits=collect_cass_hits(cass_outputs, config),
+        doc_hits=doc_hits,
+    )
+
+
+async def run_command_async(
+    cmd: list[str],
+    timeout: float | None = None,
+) -> tuple[int, bytes, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *spawn_command(cmd),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return 124, b"", f"timed out after {timeout}s"
+    return proc.returncode, stdout, stderr.decode(errors="replace")
+
+
+async def run_cass_queries_async(
+    queries: Sequence[str],
+    since: datetime | None,
+    config: Config,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[dict | None]:
+    if config.cass_url or (len(queries) > 1 and cass_supports_batch(config.cass_path)):
+        return await asyncio.to_thread(run_cass_queries, queries, since, config)
+    
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, min(len(queries), config.max_parallel)))
+    
+    async def run_one(query: str) -> tuple[int, bytes, str]:
+        async with semaphore:
+            return await run_command_async(
+                build_cass_query(query, since, config.agents, config.workspace_include, config.cass_path),
+                timeout=CASS_SEARCH_TIMEOUT,
+            )
+    
+    outputs = await asyncio.gather(*(run_one(query) for query in queries))
+    return [parse_cass_output(stdout) if code == 0 else None for code, stdout, _ in outputs]
+
+
+async def search_category_async(
+    category: dict,
+    since: datetime | None,
+    config: Config,
+    query_semaphore: asyncio.Semaphore | None = None,
+) -> CategoryResult:
+    name = category["name"]
+    queries = category.get("queries", [])
+    
+    cass_outputs, doc_hits = await asyncio.gather(
+        run_cass_queries_async(queries, since, config, query_semaphore),
+        asyncio.to_thread(collect_doc_hits, queries, since, config),
+    )
+    
+    return CategoryResult(
+        name=name,
+        display=category.get("display", name),
+        description=category.get("description", ""),
+        cass_hits=collect_cass_hits(cass_outputs, config),
+        doc_hits=doc_hits,
+    )
+
+
+async def search_categories_async(
+    categories: list[dict],
+    since: datetime | None,
+    config: Config,
+    on_result: Callable[[CategoryResult], None] | None = None,
+) -> list[CategoryResult]:
+    semaphore = asyncio.Semaphore(config.max_parallel)
+    query_semaphore = asyncio.Semaphore(config.max_parallel)
+    await asyncio.to_thread(cass_supports_batch, config.cass_path)
+    
+    async def search_one(category: dict) -> CategoryResult:
+        async with semaphore:
+            try:
+                result = await search_category_async(category, since, config, query_semaphore)
+            except Exception as e:
+                result = CategoryResult(
+                    name=category["name"],
+                    display=category["name"],
+                    description="",
+                    cass_hits=[],
+                    error=str(e),
+                )
+        if on_result:
+            on_result(result)
+        return result
+    
+    return await asyncio.gather(*(search_one(category) for category in categories))
+
+
+def llm_cache_path(config: Config, prompt: str) -> Path:
+    key = hashlib.blake2b(f"{config.llm_method}\0{prompt}".encode(), digest_size=16).hexdigest()
+    return config.output_dir / ".llm-cache" / f"{key}.json"
+
+
+def load_llm_cache(cache_path: Path) -> dict | None:
+    try:
+        data = json_loads(cache_path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_llm_cache(cache_path: Path, data: dict) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(json_dumpb(data))
+    except OSError:
+        pass
+
+
+def prune_llm_cache(config: Config) -> int:
+    cutoff = time.time() - max(config.trend_window, 1) * 86_400
+    removed = 0
+    try:
+        with os.scandir(config.output_dir / ".llm-cache") as it:
+            for entry in it:
+                try:
+                    if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return removed
+
+
+def llm_retry_delay(attempt: int, retry_backoff: list[int]) -> float:
+    base = retry_backoff[0]
+    return min(base * 2 ** attempt + random.uniform(0, base), max(retry_backoff))
+
+
+def llm_response_error(data) -> str | None:
+    if not isinstance(data, dict):
+        return f"Unexpected response type: {type(data).__name__}"
+    for key in ("anti_patterns", "wins"):
+        if not isinstance(data.get(key, []), list):
+            return f"Unexpected response shape: {key} is not a list"
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def llm_slots(max_parallel: int) -> threading.BoundedSemaphore:
+    return threading.BoundedSemaphore(max(1, max_parallel))
+
+
+def run_llm_prompt(
+    prompt: str,
+    config: Config,
+    use_cache: bool = True,
+) -> tuple[dict | None, str | None]:
+    cache_path = llm_cache_path(config, prompt)
+    if use_cache:
+        cached = load_llm_cache(cache_path)
+        if cached is not None:
+            return cached, None
+    
+    llm_cmd = [config.llm_method, "-p"]
+    error = None
+    
+    for attempt in range(config.max_retries):
+        with llm_slots(config.max_parallel):
+            code, stdout, stderr = run_command(llm_cmd, input_text=prompt, timeout=LLM_TIMEOUT)
         
         if code == 0 and stdout.strip():
             try:
-                data = json.loads(stdout)
-                for hit in data.get("hits", []):
-                    workspace = hit.get("workspace", "")
-                    if config.workspace_exclude and any(excl in workspace for excl in config.workspace_exclude):
-                        continue
-                    path_key = f"{hit.get('source_path')}:{hit.get('line_number', 0)}"
-                    if path_key not in seen_cass_paths:
-                        seen_cass_paths.add(path_key)
-                        all_cass_hits.append(hit)
-            except json.JSONDecodeError:
-                pass
+                response_text = stdout.strip()
+                fence_match = _FENCE_RE.match(response_text)
+                if fence_match:
+                    response_text = fence_match.group(1)
+                
+                data = json_loads(response_text)
+            except json.JSONDecodeError as e:
+                error = f"JSON parse error: {e}"
+            else:
+                schema_error = llm_response_error(data)
+                if schema_error:
+                    return None, schema_error
+                if use_cache:
+                    save_llm_cache(cache_path, data)
+                return data, None
+        else:
+            error = f"{config.llm_method} command failed: {stderr}"
         
-        if config.extra_dirs:
-            doc_hits = search_extra_dirs(query, config.extra_dirs, config.extra_patterns, since)
-            for hit in doc_hits:
-                path_key = f"{hit['source_path']}:{hit['line_number']}"
-                if path_key not in seen_doc_paths:
-                    seen_doc_paths.add(path_key)
-                    all_doc_hits.append(hit)
+        if attempt < config.max_retries - 1 and config.retry_backoff:
+            time.sleep(llm_retry_delay(attempt, config.retry_backoff))
     
-    return CategoryResult(
-        name=name,
-        display=display,
-        description=description,
-        cass_hits=all_cass_hits,
-        doc_hits=all_doc_hits,
-    )
+    return None, error or "Max retries exceeded"
+
+
+def merge_llm_responses(responses: list[dict]) -> dict:
+    if len(responses) == 1:
+        return responses[0]
+    
+    def dedup_by_description(items) -> list[dict]:
+        merged: dict[str, dict] = {}
+        for item in items:
+            merged.setdefault(item.get("description", ""), item)
+        return list(merged.values())
+    
+    summaries = dict.fromkeys(r.get("summary", "") for r in responses if r.get("summary"))
+    return {
+        "anti_patterns": dedup_by_description(
+            itertools.chain.from_iterable(r.get("anti_patterns", []) for r in responses)
+        ),
+        "wins": dedup_by_description(
+            itertools.chain.from_iterable(r.get("wins", []) for r in responses)
+        ),
+        "summary": " ".join(summaries),
+    }
+
+
+def trim_hits_for_prompt(hits: list[dict]) -> list[dict]:
+    trimmed = []
+    for hit in hits:
+        content = hit.get("content")
+        if isinstance(content, str) and len(content) > LLM_HIT_CONTENT_CHARS:
+            hit = {**hit, "content": content[:LLM_HIT_CONTENT_CHARS]}
+        trimmed.append(hit)
+    return trimmed
 
 
 def analyze_with_llm(
@@ -451,6 +1146,7 @@ def analyze_with_llm(
     prompt_template: str,
     config: Config,
     dry_run: bool = False,
+    use_cache: bool = True,
 ) -> CategoryResult:
     total_hits = len(result.cass_hits) + len(result.doc_hits)
     
@@ -463,46 +1159,47 @@ def analyze_with_llm(
         result.anti_patterns = [{"description": "[DRY RUN] Skipped", "severity": "low", "occurrences": 0}]
         return result
     
-    combined_data = {
-        "cass_sessions": result.cass_hits,
-        "documentation": result.doc_hits,
-    }
-    
-    prompt = prompt_template.format(
-        category_name=result.display,
-        category_description=result.description,
-        cass_results=json.dumps(combined_data, indent=2),
+    shard_count = max(
+        -(-len(result.cass_hits) // LLM_SHARD_SIZE),
+        -(-len(result.doc_hits) // LLM_SHARD_SIZE),
     )
+    cass_hits = trim_hits_for_prompt(result.cass_hits)
+    prompts = [
+        prompt_template.format(
+            category_name=result.display,
+            category_description=result.description,
+            cass_results=json_dumps({
+                "cass_sessions": cass_hits[i * LLM_SHARD_SIZE:(i + 1) * LLM_SHARD_SIZE],
+                "documentation": result.doc_hits[i * LLM_SHARD_SIZE:(i + 1) * LLM_SHARD_SIZE],
+            }),
+        )
+        for i in range(shard_count)
+    ]
     
-    llm_cmd = [config.llm_method, "-p", prompt]
+    if len(prompts) == 1:
+        responses = [run_llm_prompt(prompts[0], config, use_cache)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(prompts), config.max_parallel)) as executor:
+            responses = list(executor.map(lambda prompt: run_llm_prompt(prompt, config, use_cache), prompts))
     
-    for attempt in range(config.max_retries):
-        code, stdout, stderr = run_command(llm_cmd)
-        
-        if code == 0 and stdout.strip():
-            try:
-                response_text = stdout.strip()
-                fence_match = re.match(r'^```(?:json)?\s*\n(.*?)\n```\s*$', response_text, re.DOTALL)
-                if fence_match:
-                    response_text = fence_match.group(1)
-                
-                data = json.loads(response_text)
-                result.anti_patterns = data.get("anti_patterns", [])
-                result.wins = data.get("wins", [])
-                result.summary = data.get("summary", "")
-                return result
-            except json.JSONDecodeError as e:
-                result.error = f"JSON parse error: {e}"
-        else:
-            result.error = f"{config.llm_method} command failed: {stderr}"
-        
-        if attempt < config.max_retries - 1 and config.retry_backoff:
-            backoff = config.retry_backoff[min(attempt, len(config.retry_backoff) - 1)]
-            time.sleep(backoff)
+    parsed = [data for data, _ in responses if data is not None]
+    errors = [error for data, error in responses if data is None]
+    
+    if not parsed:
+        result.error = errors[0]
+        result.summary = f"Analysis failed: {result.error}"
+        return result
     
-    if not result.error:
-        result.error = "Max retries exceeded"
-    result.summary = f"Analysis failed: {result.error}"
+    data = merge_llm_responses(parsed)
+    result.anti_patterns = data.get("anti_patterns", [])
+    result.wins = data.get("wins", [])
+    for item in result.anti_patterns:
+        severity = item.get("severity") if isinstance(item, dict) else None
+        if isinstance(severity, str):
+            item["severity"] = sys.intern(severity)
+    result.summary = data.get("summary", "")
+    if errors:
+        result.error = f"{len(errors)} of {len(prompts)} shards failed: {errors[0]}"
     return result
 
 
@@ -514,16 +1211,16 @@ def extract_work_from_sessions(
     cmd = [cass_path, "search", "*", "--robot", "--limit", "500"]
     cmd.extend(["--since", since.strftime("%Y-%m-%dT%H:%M:%S")])
     
-    code, stdout, _ = run_command(cmd)
+    code, stdout, _ = run_command_bytes(cmd, timeout=CASS_SEARCH_TIMEOUT)
     
     if code != 0 or not stdout.strip():
         return []
     
     try:
-        data = json.loads(stdout)
-        return data.get("hits", [])
+        data = json_loads(stdout)
     except json.JSONDecodeError:
         return []
+    return intern_hit_fields(data.get("hits", []))
 
 
 def scan_docs_for_changes(
@@ -534,86 +1231,119 @@ def scan_docs_for_changes(
     created = []
     modified = []
     
-    for dir_path in extra_dirs:
-        if not dir_path.exists():
+    for entry in _scan_docs_once(tuple(extra_dirs), tuple(patterns)):
+        if entry.mtime < since:
             continue
         
-        for pattern in patterns:
-            for file_path in dir_path.glob(pattern):
-                if not file_path.is_file():
-                    continue
-                
-                try:
-                    stat = file_path.stat()
-                    mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-                    ctime = datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc)
-                    
-                    if mtime < since:
-                        continue
-                    
-                    doc_info = {
-                        "path": str(file_path),
-                        "name": file_path.name,
-                        "modified_at": mtime.isoformat(),
-                    }
-                    
-                    if ctime >= since:
-                        created.append(doc_info)
-                    else:
-                        modified.append(doc_info)
-                except OSError:
-                    pass
+        doc_info = {
+            "path": entry.path,
+            "name": entry.name,
+            "modified_at": entry.mtime.isoformat(),
+        }
+        
+        if entry.ctime >= since:
+            created.append(doc_info)
+        else:
+            modified.append(doc_info)
     
     return created, modified
 
 
+def project_name_for(workspace: str | None) -> str:
+    if not workspace:
+        return "unknown"
+    name = workspace.rpartition("/")[2]
+    if name and name != ".":
+        return name
+    return Path(workspace).name
+
+
 def group_sessions_by_project(sessions: list[dict]) -> dict[str, list[dict]]:
     projects: dict[str, list[dict]] = defaultdict(list)
     
     for session in sessions:
-        workspace = session.get("workspace", "unknown")
-        project_name = Path(workspace).name if workspace else "unknown"
-        projects[project_name].append(session)
+        projects[sys.intern(project_name_for(session.get("workspace", "unknown")))].append(session)
     
     return dict(projects)
 
 
-def extract_files_from_sessions(sessions: list[dict]) -> set[str]:
-    files = set()
+def extract_files_from_sessions(sessions: list[dict]) -> dict[str, None]:
+    files: dict[str, None] = {}
     
     for session in sessions:
-        content = session.get("content", "")
-        file_patterns = re.findall(r'(?:wrote|created|modified|edited|read)\s+[`"]?([^\s`"]+\.\w+)[`"]?', content, re.IGNORECASE)
-        files.update(file_patterns)
+        files.update(dict.fromkeys(_FILE_MENTION_RE.findall(session.get("content", ""))))
     
     return files
 
 
-def estimate_session_time(sessions: list[dict]) -> int:
-    if not sessions:
-        return 0
+def parse_utc_iso_ms(value: str) -> int | None:
+    if len(value) < 20 or value[4] != "-" or value[7] != "-" or value[13] != ":" or value[16] != ":":
+        return None
     
-    timestamps = []
-    for session in sessions:
-        created_at = session.get("created_at")
-        if created_at:
-            if isinstance(created_at, int):
-                timestamps.append(created_at)
-            elif isinstance(created_at, str):
-                try:
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    timestamps.append(int(dt.timestamp() * 1000))
-                except ValueError:
-                    pass
+    tail = value[19:]
+    if tail == "Z" or tail == "+00:00":
+        ms = 0
+    elif tail[0] == "." and (tail[-1] == "Z" or tail.endswith("+00:00")):
+        fraction = tail[1:-1] if tail[-1] == "Z" else tail[1:-6]
+        if not fraction.isdigit():
+            return None
+        ms = int(fraction[:3].ljust(3, "0"))
+    else:
+        return None
+    
+    parts = (value[0:4], value[5:7], value[8:10], value[11:13], value[14:16], value[17:19])
+    if not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+    
+    year, month, day, hour, minute, second = map(int, parts)
+    if not (
+        year >= 1
+        and 1 <= month <= 12
+        and 1 <= day <= calendar.monthrange(year, month)[1]
+        and hour < 24
+        and minute < 60
+        and second < 60
+    ):
+        return None
+    
+    seconds = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+    return seconds * 1000 + ms
+
+
+def session_timestamp_ms(session: dict) -> int | None:
+    created_at = session.get("created_at")
+    if not created_at:
+        return None
+    if isinstance(created_at, int):
+        return created_at
+    if isinstance(created_at, str):
+        ts = parse_utc_iso_ms(created_at)
+        if ts is not None:
+            return ts
+        try:
+            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+            return int(dt.timestamp() * 1000)
+        except ValueError:
+            pass
+    return None
+
+
+def estimate_minutes(timestamps: list[int], session_count: int) -> int:
+    if not session_count:
+        return 0
     
     if len(timestamps) < 2:
-        return len(sessions) * 5
+        return session_count * 5
     
-    timestamps.sort()
-    total_ms = timestamps[-1] - timestamps[0]
+    total_ms = max(timestamps) - min(timestamps)
     return max(5, min(480, total_ms // 60000))
 
 
+def estimate_session_time(sessions: list[dict]) -> int:
+    timestamps = [ts for ts in map(session_timestamp_ms, sessions) if ts is not None]
+    return estimate_minutes(timestamps, len(sessions))
+
+
 def generate_worklog(
     sessions: list[dict],
     extra_dirs: list[Path],
@@ -624,20 +1354,28 @@ def generate_worklog(
 ) -> WorkLog:
     today = datetime.now().date().isoformat()
     
-    project_groups = group_sessions_by_project(sessions)
+    project_groups: dict[str, tuple[list[dict], dict[str, None], list[int]]] = {}
+    
+    for session in sessions:
+        project_name = sys.intern(project_name_for(session.get("workspace", "unknown")))
+        group = project_groups.get(project_name)
+        if group is None:
+            group = project_groups[project_name] = ([], {}, [])
+        project_sessions, files, timestamps = group
+        project_sessions.append(session)
+        files.update(dict.fromkeys(_FILE_MENTION_RE.findall(session.get("content", ""))))
+        ts = session_timestamp_ms(session)
+        if ts is not None:
+            timestamps.append(ts)
     
     projects = []
-    for project_name, project_sessions in project_groups.items():
-        workspace = project_sessions[0].get("workspace", "") if project_sessions else ""
-        files = extract_files_from_sessions(project_sessions)
-        estimated_minutes = estimate_session_time(project_sessions)
-        
+    for project_name, (project_sessions, files, timestamps) in project_groups.items():
         projects.append(ProjectWork(
             name=project_name,
-            workspace=workspace,
+            workspace=project_sessions[0].get("workspace", ""),
             sessions=project_sessions,
             files_modified=files,
-            estimated_minutes=estimated_minutes,
+            estimated_minutes=estimate_minutes(timestamps, len(project_sessions)),
         ))
     
     projects.sort(key=lambda p: len(p.sessions), reverse=True)
@@ -664,81 +1402,76 @@ def generate_worklog(
 
 
 def generate_worklog_markdown(worklog: WorkLog) -> str:
-    lines = [
-        f"# Daily Work Log - {worklog.date}",
-        "",
-        "## Summary",
-        "",
-        f"- **Total sessions**: {worklog.total_sessions}",
-        f"- **Estimated time**: {worklog.total_estimated_minutes} minutes (~{worklog.total_estimated_minutes // 60}h {worklog.total_estimated_minutes % 60}m)",
-        f"- **Projects touched**: {len(worklog.projects)}",
-        f"- **Docs created**: {len(worklog.docs_created)}",
-        f"- **Docs modified**: {len(worklog.docs_modified)}",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    
+    w(f"# Daily Work Log - {worklog.date}\n\n")
+    w("## Summary\n\n")
+    w(f"- **Total sessions**: {worklog.total_sessions}\n")
+    w(f"- **Estimated time**: {worklog.total_estimated_minutes} minutes (~{worklog.total_estimated_minutes // 60}h {worklog.total_estimated_minutes % 60}m)\n")
+    w(f"- **Projects touched**: {len(worklog.projects)}\n")
+    w(f"- **Docs created**: {len(worklog.docs_created)}\n")
+    w(f"- **Docs modified**: {len(worklog.docs_modified)}\n\n")
     
     if worklog.highlights:
-        lines.extend(["## Highlights", ""])
+        w("## Highlights\n\n")
         for highlight in worklog.highlights:
-            lines.append(f"- {highlight}")
-        lines.append("")
+            w(f"- {highlight}\n")
+        w("\n")
     
-    lines.extend(["## Projects", ""])
+    w("## Projects\n\n")
     
     for project in worklog.projects:
-        session_count = len(project.sessions)
         files_count = len(project.files_modified)
-        lines.append(f"### {project.name}")
-        lines.append("")
-        lines.append(f"- **Sessions**: {session_count}")
-        lines.append(f"- **Estimated time**: {project.estimated_minutes} minutes")
-        lines.append(f"- **Files touched**: {files_count}")
+        w(f"### {project.name}\n\n")
+        w(f"- **Sessions**: {len(project.sessions)}\n")
+        w(f"- **Estimated time**: {project.estimated_minutes} minutes\n")
+        w(f"- **Files touched**: {files_count}\n")
         
         if project.files_modified:
-            lines.append(f"- **Files**: {', '.join(list(project.files_modified)[:10])}")
+            w(f"- **Files**: {', '.join(itertools.islice(project.files_modified, 10))}\n")
             if files_count > 10:
-                lines.append(f"  - ...and {files_count - 10} more")
+                w(f"  - ...and {files_count - 10} more\n")
         
         if project.workspace:
-            lines.append(f"- **Workspace**: `{project.workspace}`")
+            w(f"- **Workspace**: `{project.workspace}`\n")
         
-        lines.append("")
+        w("\n")
     
     if worklog.docs_created:
-        lines.extend(["## Docs Created", ""])
+        w("## Docs Created\n\n")
         for doc in worklog.docs_created:
-            lines.append(f"- `{doc['path']}`")
-        lines.append("")
+            w(f"- `{doc['path']}`\n")
+        w("\n")
     
     if worklog.docs_modified:
-        lines.extend(["## Docs Modified", ""])
+        w("## Docs Modified\n\n")
         for doc in worklog.docs_modified:
-            lines.append(f"- `{doc['path']}`")
-        lines.append("")
+            w(f"- `{doc['path']}`\n")
+        w("\n")
     
-    return "\n".join(lines)
+    return buf.getvalue().removesuffix("\n")
 
 
-def generate_succinct_worklog(worklog: WorkLog) -> str:
-    lines = [
-        "## Daily Work Log",
-        "",
-        f"**{worklog.total_sessions} sessions** across **{len(worklog.projects)} projects** (~{worklog.total_estimated_minutes // 60}h {worklog.total_estimated_minutes % 60}m)",
-        "",
-    ]
+def write_succinct_worklog(w: Callable[[str], object], worklog: WorkLog) -> None:
+    w("## Daily Work Log\n\n")
+    w(f"**{worklog.total_sessions} sessions** across **{len(worklog.projects)} projects** (~{worklog.total_estimated_minutes // 60}h {worklog.total_estimated_minutes % 60}m)\n\n")
     
     for project in worklog.projects[:5]:
-        files_preview = ", ".join(list(project.files_modified)[:3]) if project.files_modified else "no files tracked"
-        lines.append(f"- **{project.name}**: {len(project.sessions)} sessions, {project.estimated_minutes}m ({files_preview})")
+        files_preview = ", ".join(itertools.islice(project.files_modified, 3)) if project.files_modified else "no files tracked"
+        w(f"- **{project.name}**: {len(project.sessions)} sessions, {project.estimated_minutes}m ({files_preview})\n")
     
     if len(worklog.projects) > 5:
-        lines.append(f"- ...and {len(worklog.projects) - 5} more projects")
+        w(f"- ...and {len(worklog.projects) - 5} more projects\n")
     
     if worklog.docs_created:
-        lines.append("")
-        lines.append(f"**Docs created**: {len(worklog.docs_created)}")
-    
-    return "\n".join(lines)
+        w(f"\n**Docs created**: {len(worklog.docs_created)}\n")
+
+
+def generate_succinct_worklog(worklog: WorkLog) -> str:
+    buf = io.StringIO()
+    write_succinct_worklog(buf.write, worklog)
+    return buf.getvalue().removesuffix("\n")
 
 
 def generate_worklog_json(worklog: WorkLog) -> dict:
@@ -767,37 +1500,80 @@ def generate_worklog_json(worklog: WorkLog) -> dict:
     }
 
 
-def load_historical_data(output_dir: Path, days: int) -> list[dict]:
-    reports = []
-    today = datetime.now().date()
+def read_historical_counts(report_path: str) -> dict[str, int] | None:
+    try:
+        with open(report_path, "rb") as f:
+            data = json_loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return None
     
+    if report_path.endswith(".counts.json"):
+        return data
+    return {
+        name: len(cat_data.get("anti_patterns", []))
+        for name, cat_data in data.get("categories", {}).items()
+    }
+
+
+def load_historical_data(output_dir: Path, days: int, use_cache: bool = True) -> list[dict[str, int]]:
+    if days < 1:
+        return []
+    
+    try:
+        with os.scandir(output_dir) as it:
+            entries = {
+                entry.name: entry
+                for entry in it
+                if entry.name.startswith("daily-report-") and entry.name.endswith(".json")
+            }
+    except OSError:
+        return []
+    
+    today = datetime.now().date()
+    report_entries = []
     for i in range(1, days + 1):
-        date = today - timedelta(days=i)
-        json_file = output_dir / f"daily-report-{date.isoformat()}.json"
-        if json_file.exists():
-            try:
-                with open(json_file) as f:
-                    reports.append(json.load(f))
-            except (json.JSONDecodeError, OSError):
-                pass
+        day = (today - timedelta(days=i)).isoformat()
+        entry = entries.get(f"daily-report-{day}.counts.json") or entries.get(f"daily-report-{day}.json")
+        if entry:
+            report_entries.append(entry)
+    
+    if not report_entries:
+        return []
+    
+    report_paths = [entry.path for entry in report_entries]
+    try:
+        cache_key = tuple(
+            (entry.name, st.st_mtime_ns, st.st_size)
+            for entry in report_entries
+            for st in (entry.stat(),)
+        )
+    except OSError:
+        cache_key = None
+    
+    cache_path = output_dir / ".history-cache.pkl"
+    if use_cache and cache_key is not None:
+        cached = load_pickle_cache(cache_path, cache_key)
+        if isinstance(cached, list):
+            return cached
     
-    return reports
+    with ThreadPoolExecutor(max_workers=min(len(report_paths), 8)) as executor:
+        history = [counts for counts in executor.map(read_historical_counts, report_paths) if counts is not None]
+    
+    if cache_key is not None:
+        save_pickle_cache(cache_path, cache_key, history)
+    return history
 
 
 def calculate_trends(
     current_results: dict[str, CategoryResult],
-    historical: list[dict],
+    historical: list[dict[str, int]],
 ) -> dict[str, dict]:
     trends = {}
     
     for name, result in current_results.items():
         current_count = len(result.anti_patterns)
         
-        historical_counts = []
-        for report in historical:
-            if "categories" in report and name in report["categories"]:
-                cat_data = report["categories"][name]
-                historical_counts.append(len(cat_data.get("anti_patterns", [])))
+        historical_counts = [counts[name] for counts in historical if name in counts]
         
         if historical_counts:
             avg = sum(historical_counts) / len(historical_counts)
@@ -815,6 +1591,36 @@ def calculate_trends(
     return trends
 
 
+def format_session(session: str | list | tuple | dict) -> str:
+    if isinstance(session, (list, tuple)) and len(session) == 2:
+        path, line = session
+        return f"{path}:{line}" if line else str(path)
+    if isinstance(session, dict) and "path" in session:
+        path, line = session["path"], session.get("line")
+        return f"{path}:{line}" if line else str(path)
+    return str(session)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_session(session: str) -> tuple[str, int]:
+    path, sep, line = session.rpartition(":")
+    if sep and line.isdecimal():
+        return path, int(line)
+    return session, 0
+
+
+def session_link(session: str | list | tuple | dict, category: str) -> dict:
+    if isinstance(session, str):
+        path, line = _parse_session(session)
+    elif isinstance(session, (list, tuple)) and len(session) == 2:
+        path, line = session
+    elif isinstance(session, dict) and "path" in session:
+        path, line = session["path"], session.get("line") or 0
+    else:
+        path, line = str(session), 0
+    return {"path": path, "line": line, "category": category}
+
+
 def generate_markdown_report(
     results: dict[str, CategoryResult],
     trends: dict[str, dict],
@@ -824,111 +1630,160 @@ def generate_markdown_report(
     date_str = metadata["date"]
     total_sessions = metadata["total_sessions"]
     
-    total_anti = sum(len(r.anti_patterns) for r in results.values())
+    counts = {name: len(r.anti_patterns) for name, r in results.items()}
+    trend_cache = {name: trends.get(name, {}) for name in results}
+    
+    def delta_str(delta: float) -> str:
+        return f"+{delta}" if delta > 0 else ("0" if delta == 0 else str(delta))
+    
+    total_anti = sum(counts.values())
     total_wins = sum(len(r.wins) for r in results.values())
     
-    top_issue = max(results.items(), key=lambda x: len(x[1].anti_patterns), default=(None, None))
+    top_issue = max(results.items(), key=lambda x: counts[x[0]], default=(None, None))
     top_issue_name = top_issue[0] if top_issue[0] else "None"
     
-    lines = [
-        f"# Agent Reflection Report - {date_str}",
-        "",
-        "> Daily analysis of coding agent sessions for patterns and improvements",
-        "",
-        "## Executive Summary",
-        "",
-        f"- **{total_anti} anti-patterns** detected across {total_sessions} sessions",
-        f"- **{total_wins} wins** identified showing good practices",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    
+    w(f"# Agent Reflection Report - {date_str}\n\n")
+    w("> Daily analysis of coding agent sessions for patterns and improvements\n\n")
+    w("## Executive Summary\n\n")
+    w(f"- **{total_anti} anti-patterns** detected across {total_sessions} sessions\n")
+    w(f"- **{total_wins} wins** identified showing good practices\n")
     
     if top_issue_name != "None" and top_issue[1]:
-        trend = trends.get(top_issue_name, {})
-        delta = trend.get("delta", 0)
-        delta_str = f"+{delta}" if delta > 0 else ("0" if delta == 0 else str(delta))
-        lines.append(f"- **{results[top_issue_name].display}** is the most common issue ({delta_str} vs 7-day avg)")
+        delta = trend_cache[top_issue_name].get("delta", 0)
+        w(f"- **{results[top_issue_name].display}** is the most common issue ({delta_str(delta)} vs 7-day avg)\n")
     
     if worklog:
-        lines.append("")
-        lines.append(generate_succinct_worklog(worklog))
+        w("\n")
+        write_succinct_worklog(w, worklog)
     
-    lines.extend(["", "## Anti-Patterns by Category", ""])
+    w("\n## Anti-Patterns by Category\n\n")
     
     for name, result in results.items():
         if not result.anti_patterns:
             continue
         
-        trend = trends.get(name, {})
-        delta = trend.get("delta", 0)
-        delta_str = f"+{delta}" if delta > 0 else ("0" if delta == 0 else str(delta))
+        delta = trend_cache[name].get("delta", 0)
         
         source_info = f"{len(result.cass_hits)} CASS"
         if result.doc_hits:
             source_info += f" + {len(result.doc_hits)} docs"
         
-        lines.append(f"### {result.display} ({len(result.anti_patterns)} occurrences, {delta_str} vs avg)")
-        lines.append(f"*Sources: {source_info}*")
-        lines.append("")
+        w(f"### {result.display} ({counts[name]} occurrences, {delta_str(delta)} vs avg)\n")
+        w(f"*Sources: {source_info}*\n\n")
         
         for ap in result.anti_patterns[:5]:
             severity = ap.get("severity", "medium")
             desc = ap.get("description", "No description")
-            lines.append(f"- **[{severity.upper()}]** {desc}")
+            w(f"- **[{severity.upper()}]** {desc}\n")
             
             for session in ap.get("example_sessions", [])[:2]:
-                lines.append(f"  - `{session}`")
+                w(f"  - `{format_session(session)}`\n")
             
             if ap.get("recommendation"):
-                lines.append(f"  - *Recommendation*: {ap['recommendation']}")
+                w(f"  - *Recommendation*: {ap['recommendation']}\n")
         
-        lines.append("")
+        w("\n")
     
-    lines.extend(["## Wins", ""])
+    w("## Wins\n\n")
     
     for name, result in results.items():
         if not result.wins:
             continue
         
-        lines.append(f"### {result.display}")
-        lines.append("")
+        w(f"### {result.display}\n\n")
         
         for win in result.wins[:3]:
             desc = win.get("description", "No description")
-            lines.append(f"- {desc}")
+            w(f"- {desc}\n")
             for session in win.get("example_sessions", [])[:2]:
-                lines.append(f"  - `{session}`")
+                w(f"  - `{format_session(session)}`\n")
         
-        lines.append("")
+        w("\n")
     
-    lines.extend(["## Trends (7-Day Rolling)", "", "| Category | Today | 7-Day Avg | Delta |", "|----------|-------|-----------|-------|"])
+    w("## Trends (7-Day Rolling)\n\n")
+    w("| Category | Today | 7-Day Avg | Delta |\n")
+    w("|----------|-------|-----------|-------|\n")
     
     for name, result in results.items():
-        trend = trends.get(name, {})
+        trend = trend_cache[name]
         current = trend.get("current", 0)
         avg = trend.get("seven_day_avg", 0)
         delta = trend.get("delta", 0)
-        delta_str = f"+{delta}" if delta > 0 else ("0" if delta == 0 else str(delta))
-        lines.append(f"| {result.display} | {current} | {avg} | {delta_str} |")
-    
-    lines.extend([
-        "",
-        "## Raw Data",
-        "",
-        f"- **Sessions analyzed**: {total_sessions}",
-        f"- **Time range**: {metadata.get('since', 'N/A')} to {metadata.get('until', 'N/A')}",
-        f"- **Categories analyzed**: {len(results)}",
-    ])
+        w(f"| {result.display} | {current} | {avg} | {delta_str(delta)} |\n")
+    
+    w("\n## Raw Data\n\n")
+    w(f"- **Sessions analyzed**: {total_sessions}\n")
+    w(f"- **Time range**: {metadata.get('since', 'N/A')} to {metadata.get('until', 'N/A')}\n")
+    w(f"- **Categories analyzed**: {len(results)}\n")
     
     if metadata.get("extra_dirs"):
-        lines.append(f"- **Extra dirs scanned**: {', '.join(metadata['extra_dirs'])}")
+        w(f"- **Extra dirs scanned**: {', '.join(metadata['extra_dirs'])}\n")
     
-    lines.extend(["", "## Session Links", "", "All sessions with findings (VS Code clickable):", ""])
+    w("\n## Session Links\n\n")
+    w("All sessions with findings (VS Code clickable):\n\n")
     
     for name, result in results.items():
-        for ap in result.anti_patterns:
-            for session in ap.get("example_sessions", []):
-                lines.append(f"- `{session}` - {result.display}")
+        sessions = itertools.chain.from_iterable(ap.get("example_sessions", []) for ap in result.anti_patterns)
+        for session in itertools.islice(sessions, MAX_SESSION_LINKS_PER_CATEGORY):
+            w(f"- `{format_session(session)}` - {result.display}\n")
+    
+    return buf.getvalue().removesuffix("\n")
+
+
+def build_activity_records(sessions: list[dict]) -> list[ActivityRecord]:
+    default_ts_ms = int(datetime.now().timestamp() * 1000)
+    date_cache: dict[int, str] = {}
+    project_cache: dict[str, str | None] = {}
+    
+    activities = []
+    for session in sessions:
+        timestamp_ms = session_timestamp_ms(session)
+        if timestamp_ms is None:
+            timestamp_ms = default_ts_ms
+        
+        day_key = timestamp_ms // 86_400_000
+        activity_date = date_cache.get(day_key)
+        if activity_date is None:
+            activity_date = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).date().isoformat()
+            date_cache[day_key] = activity_date
+        
+        workspace = session.get("workspace")
+        if workspace in project_cache:
+            project = project_cache[workspace]
+        else:
+            project = project_cache[workspace] = project_name_for(workspace) if workspace else None
+        
+        activities.append(ActivityRecord(
+            timestamp=timestamp_ms,
+            date=activity_date,
+            source_id=f"cass:{session.get('source_path', '')}:{session.get('line_number', 0)}",
+            project=project,
+            workspace=workspace,
+            session_path=session.get("source_path"),
+            line_number=session.get("line_number"),
+            agent=session.get("agent"),
+            title=session.get("title"),
+        ))
     
-    return "\n".join(lines)
+    return activities
+
+
+def post_convex_mutation(client, url: str, payload: bytes, headers: dict):
+    import httpx
+    
+    for attempt in range(CONVEX_MAX_ATTEMPTS):
+        try:
+            resp = client.post(url, content=payload, headers=headers, timeout=CONVEX_TIMEOUT)
+        except httpx.TransportError:
+            if attempt == CONVEX_MAX_ATTEMPTS - 1:
+                raise
+        else:
+            if resp.status_code < 500 or attempt == CONVEX_MAX_ATTEMPTS - 1:
+                return resp
+        time.sleep(0.5 * 2 ** attempt)
 
 
 def push_to_convex(
@@ -939,42 +1794,7 @@ def push_to_convex(
 ) -> bool:
     today = datetime.now().date().isoformat()
 
-    activities = []
-    for session in sessions:
-        created_at = session.get("created_at")
-        if created_at:
-            if isinstance(created_at, int):
-                timestamp_ms = created_at
-            elif isinstance(created_at, str):
-                try:
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    timestamp_ms = int(dt.timestamp() * 1000)
-                except ValueError:
-                    timestamp_ms = int(datetime.now().timestamp() * 1000)
-            else:
-                timestamp_ms = int(datetime.now().timestamp() * 1000)
-        else:
-            timestamp_ms = int(datetime.now().timestamp() * 1000)
-
-        activity_date = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).date().isoformat()
-
-        activities.append({
-            "type": "session_message",
-            "timestamp": timestamp_ms,
-            "date": activity_date,
-            "source": "cass",
-            "sourceId": f"cass:{session.get('source_path', '')}:{session.get('line_number', 0)}",
-            "project": Path(session.get("workspace", "")).name if session.get("workspace") else None,
-            "workspace": session.get("workspace"),
-            "isPublic": False,
-            "payload": {
-                "sessionPath": session.get("source_path"),
-                "lineNumber": session.get("line_number"),
-                "agent": session.get("agent"),
-                "workspace": session.get("workspace"),
-                "title": session.get("title"),
-            },
-        })
+    activities = build_activity_records(sessions)
 
     analysis_results = []
     for name, result in results.items():
@@ -991,35 +1811,50 @@ def push_to_convex(
             "delta": 0,
         })
 
+    if not activities and not analysis_results:
+        return True
+
+    import httpx
+
     headers = {"Content-Type": "application/json"}
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            if activities:
-                resp = client.post(
-                    f"{convex_url}/api/mutation/activities:batchInsert",
-                    json={
-                        "args": {"activities": activities},
-                        "format": "json",
-                    },
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                result_data = resp.json()
-                console.print(f"[green]Pushed {len(activities)} activities to Convex (inserted: {result_data.get('inserted', '?')})[/green]")
-
-            for ar in analysis_results:
-                resp = client.post(
-                    f"{convex_url}/api/mutation/analysisResults:upsert",
-                    json={
-                        "args": ar,
-                        "format": "json",
-                    },
-                    headers=headers,
-                )
+        client = get_http_client()
+        if activities:
+            resp = post_convex_mutation(
+                client,
+                f"{convex_url}/api/mutation/activities:batchInsert",
+                json_dumpb({"args": {"activities": [a.to_convex() for a in activities]}, "format": "json"}),
+                headers,
+            )
+            resp.raise_for_status()
+            result_data = resp.json()
+            console.print(f"[green]Pushed {len(activities)} activities to Convex (inserted: {result_data.get('inserted', '?')})[/green]")
+
+        if analysis_results:
+            resp = post_convex_mutation(
+                client,
+                f"{convex_url}/api/mutation/analysisResults:batchUpsert",
+                json_dumpb({"args": {"results": analysis_results}, "format": "json"}),
+                headers,
+            )
+            if resp.status_code in (400, 404):
+                def upsert_one(ar: dict) -> None:
+                    post_convex_mutation(
+                        client,
+                        f"{convex_url}/api/mutation/analysisResults:upsert",
+                        json_dumpb({"args": ar, "format": "json"}),
+                        headers,
+                    ).raise_for_status()
+
+                with ThreadPoolExecutor(max_workers=min(len(analysis_results), CONVEX_MAX_PARALLEL)) as executor:
+                    futures = [executor.submit(upsert_one, ar) for ar in analysis_results]
+                for future in futures:
+                    future.result()
+            else:
                 resp.raise_for_status()
 
-            console.print(f"[green]Pushed {len(analysis_results)} analysis results to Convex[/green]")
+        console.print(f"[green]Pushed {len(analysis_results)} analysis results to Convex[/green]")
 
         return True
     except httpx.HTTPStatusError as e:
@@ -1038,43 +1873,7 @@ def push_to_sqlite(
     today = datetime.now().date().isoformat()
     db_path = os.path.expanduser("~/data/agent-reflection/reflection.db")
 
-    activities = []
-    for session in sessions:
-        created_at = session.get("created_at")
-        if created_at:
-            if isinstance(created_at, int):
-                timestamp_ms = created_at
-            elif isinstance(created_at, str):
-                try:
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    timestamp_ms = int(dt.timestamp() * 1000)
-                except ValueError:
-                    timestamp_ms = int(datetime.now().timestamp() * 1000)
-            else:
-                timestamp_ms = int(datetime.now().timestamp() * 1000)
-        else:
-            timestamp_ms = int(datetime.now().timestamp() * 1000)
-
-        activity_date = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).date().isoformat()
-
-        activities.append({
-            "type": "session_message",
-            "timestamp": timestamp_ms,
-            "date": activity_date,
-            "source": "cass",
-            "source_id": f"cass:{session.get('source_path', '')}:{session.get('line_number', 0)}",
-            "project": Path(session.get("workspace", "")).name if session.get("workspace") else None,
-            "workspace": session.get("workspace"),
-            "repo_full_name": None,
-            "is_public": 0,
-            "payload": json.dumps({
-                "sessionPath": session.get("source_path"),
-                "lineNumber": session.get("line_number"),
-                "agent": session.get("agent"),
-                "workspace": session.get("workspace"),
-                "title": session.get("title"),
-            }),
-        })
+    activities = build_activity_records(sessions)
 
     try:
         conn = sqlite3.connect(db_path)
@@ -1089,16 +1888,16 @@ def push_to_sqlite(
                     payload = excluded.payload
             """, (
                 str(uuid.uuid4()),
-                a["type"],
-                a["timestamp"],
-                a["date"],
-                a["source"],
-                a["source_id"],
-                a["project"],
-                a["workspace"],
-                a["repo_full_name"],
-                a["is_public"],
-                a["payload"],
+                a.type,
+                a.timestamp,
+                a.date,
+                a.source,
+                a.source_id,
+                a.project,
+                a.workspace,
+                None,
+                0,
+                json.dumps(a.payload()),
             ))
 
         for name, result in results.items():
@@ -1167,63 +1966,113 @@ def push_to_sqlite(
         return False
 
 
-def generate_json_report(
+def iter_json_report(
     results: dict[str, CategoryResult],
     trends: dict[str, dict],
     metadata: dict,
     worklog: WorkLog | None = None,
-) -> dict:
-    categories = {}
-    session_links = []
+) -> Iterator[tuple[str, object]]:
+    def iter_categories() -> Iterator[tuple[str, dict]]:
+        for name, result in results.items():
+            trend = trends.get(name, {})
+            yield name, {
+                "display": result.display,
+                "description": result.description,
+                "anti_patterns": result.anti_patterns,
+                "wins": result.wins,
+                "summary": result.summary,
+                "count": len(result.anti_patterns),
+                "cass_hits": len(result.cass_hits),
+                "doc_hits": len(result.doc_hits),
+                "seven_day_avg": trend.get("seven_day_avg", 0),
+                "delta": trend.get("delta", 0),
+            }
     
-    for name, result in results.items():
-        categories[name] = {
-            "display": result.display,
-            "description": result.description,
-            "anti_patterns": result.anti_patterns,
-            "wins": result.wins,
-            "summary": result.summary,
-            "count": len(result.anti_patterns),
-            "cass_hits": len(result.cass_hits),
-            "doc_hits": len(result.doc_hits),
-            "seven_day_avg": trends.get(name, {}).get("seven_day_avg", 0),
-            "delta": trends.get(name, {}).get("delta", 0),
-        }
-        
-        for ap in result.anti_patterns:
-            for session in ap.get("example_sessions", []):
-                if ":" in session:
-                    path, line = session.rsplit(":", 1)
-                    try:
-                        line_num = int(line)
-                    except ValueError:
-                        line_num = 0
-                        path = session
-                    session_links.append({"path": path, "line": line_num, "category": name})
-                else:
-                    session_links.append({"path": session, "line": 0, "category": name})
-    
-    report = {
-        "date": metadata["date"],
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "time_range": {
-            "since": metadata.get("since"),
-            "until": metadata.get("until"),
-        },
-        "summary": {
-            "total_sessions": metadata["total_sessions"],
-            "anti_pattern_count": sum(len(r.anti_patterns) for r in results.values()),
-            "win_count": sum(len(r.wins) for r in results.values()),
-        },
-        "categories": categories,
-        "session_links": session_links,
-        "trends": trends,
+    yield "date", metadata["date"]
+    yield "generated_at", datetime.now(timezone.utc).isoformat()
+    yield "time_range", {
+        "since": metadata.get("since"),
+        "until": metadata.get("until"),
+    }
+    yield "summary", {
+        "total_sessions": metadata["total_sessions"],
+        "anti_pattern_count": sum(len(r.anti_patterns) for r in results.values()),
+        "win_count": sum(len(r.wins) for r in results.values()),
     }
+    yield "categories", iter_categories()
+    yield "session_links", [
+        session_link(session, name)
+        for name, result in results.items()
+        for ap in result.anti_patterns
+        for session in ap.get("example_sessions", [])
+    ]
+    yield "trends", trends
     
     if worklog:
-        report["worklog"] = generate_worklog_json(worklog)
+        yield "worklog", generate_worklog_json(worklog)
+
+
+def generate_json_report(
+    results: dict[str, CategoryResult],
+    trends: dict[str, dict],
+    metadata: dict,
+    worklog: WorkLog | None = None,
+) -> dict:
+    return {
+        key: dict(value) if isinstance(value, Iterator) else value
+        for key, value in iter_json_report(results, trends, metadata, worklog)
+    }
+
+
+def write_json_object(f, items: Iterable[tuple[str, object]], depth: int = 0) -> None:
+    indent = b"\n" + b"  " * (depth + 1)
+    empty = True
     
-    return report
+    f.write(b"{")
+    for key, value in items:
+        f.write(indent if empty else b"," + indent)
+        empty = False
+        f.write(json_dumpb(key))
+        f.write(b": ")
+        if isinstance(value, Iterator):
+            write_json_object(f, value, depth + 1)
+        else:
+            f.write(json_dumpb(value, indent=True).replace(b"\n", indent))
+    f.write(b"}" if empty else b"\n" + b"  " * depth + b"}")
+
+
+def write_json_report(path: Path, items: Iterable[tuple[str, object]]) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            write_json_object(f, items)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def get_http_client():
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx
+            
+            _http_client = httpx.Client(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+            atexit.register(close_http_client)
+    return _http_client
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
 
 
 def send_failure_email(error: str, config: Config) -> bool:
@@ -1235,30 +2084,26 @@ def send_failure_email(error: str, config: Config) -> bool:
         console.print("[yellow]Warning: SENDGRID_API_KEY not set, skipping email[/yellow]")
         return False
     
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    body = {
+        "personalizations": [{"to": [{"email": config.email_to}]}],
+        "from": {"email": config.email_from},
+        "subject": f"Agent Reflection Failed - {datetime.now().date().isoformat()}",
+        "content": [{"type": "text/plain", "value": f"Daily report failed:\n\n{error}"}],
+    }
+    
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                "https://api.sendgrid.com/v3/mail/send",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "personalizations": [{"to": [{"email": config.email_to}]}],
-                    "from": {"email": config.email_from},
-                    "subject": f"Agent Reflection Failed - {datetime.now().date().isoformat()}",
-                    "content": [{"type": "text/plain", "value": f"Daily report failed:\n\n{error}"}],
-                },
-            )
-            return response.status_code == 202
+        response = get_http_client().post(SENDGRID_SEND_URL, headers=headers, json=body)
+        return response.status_code == 202
     except Exception as e:
         console.print(f"[red]Email send failed: {e}[/red]")
         return False
 
 
-def run_pipeline(args: argparse.Namespace) -> int:
-    config = Config.from_toml(Path(args.config).expanduser())
-    
+def run_pipeline(args: argparse.Namespace, config: Config) -> int:
     if args.output_dir:
         config.output_dir = Path(args.output_dir).expanduser()
     
@@ -1267,6 +2112,9 @@ def run_pipeline(args: argparse.Namespace) -> int:
     verbose = args.verbose
     dry_run = args.dry_run
     
+    if not dry_run:
+        prune_llm_cache(config)
+    
     if verbose:
         console.print(f"[dim]Config loaded from {args.config}[/dim]")
         console.print(f"[dim]Output directory: {config.output_dir}[/dim]")
@@ -1322,43 +2170,20 @@ def run_pipeline(args: argparse.Namespace) -> int:
         if verbose:
             console.print(f"[dim]Analyzing sessions since: {since.isoformat()}[/dim]")
         
-        all_categories = PREDEFINED_CATEGORIES + config.custom_categories
-        category_order = [cat["name"] for cat in all_categories]
+        all_categories = [*PREDEFINED_CATEGORIES, *config.custom_categories]
         
         task = progress.add_task(f"Searching {len(all_categories)} categories...", total=len(all_categories))
         
-        unordered_results: dict[str, CategoryResult] = {}
-        total_sessions = 0
-        total_doc_hits = 0
-        
-        with ThreadPoolExecutor(max_workers=config.max_parallel) as executor:
-            futures = {
-                executor.submit(search_category, cat, since, config): cat["name"]
-                for cat in all_categories
-            }
-            
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    result = future.result()
-                    unordered_results[name] = result
-                    total_sessions += len(result.cass_hits)
-                    total_doc_hits += len(result.doc_hits)
-                except Exception as e:
-                    unordered_results[name] = CategoryResult(
-                        name=name,
-                        display=name,
-                        description="",
-                        cass_hits=[],
-                        error=str(e),
-                    )
-                progress.advance(task)
+        search_results = asyncio.run(search_categories_async(
+            all_categories,
+            since,
+            config,
+            on_result=lambda _: progress.advance(task),
+        ))
         
-        results: dict[str, CategoryResult] = {
-            name: unordered_results[name] 
-            for name in category_order 
-            if name in unordered_results
-        }
+        results: dict[str, CategoryResult] = {result.name: result for result in search_results}
+        total_sessions = sum(len(r.cass_hits) for r in search_results)
+        total_doc_hits = sum(len(r.doc_hits) for r in search_results)
         
         progress.remove_task(task)
         
@@ -1371,21 +2196,38 @@ def run_pipeline(args: argparse.Namespace) -> int:
         
         task = progress.add_task("Analyzing with LLM...", total=len(results))
         
-        for name, result in results.items():
-            if verbose:
-                console.print(f"[dim]Analyzing {result.display}...[/dim]")
+        with ThreadPoolExecutor(max_workers=config.max_parallel) as executor:
+            futures = {}
+            for name, result in results.items():
+                if verbose:
+                    console.print(f"[dim]Analyzing {result.display}...[/dim]")
+                future = executor.submit(analyze_with_llm, result, prompt_template, config, dry_run, not args.no_cache)
+                futures[future] = name
             
-            results[name] = analyze_with_llm(result, prompt_template, config, dry_run)
-            progress.advance(task)
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name].error = str(e)
+                    results[name].summary = f"Analysis failed: {e}"
+                progress.advance(task)
         
         progress.remove_task(task)
         
+        all_sessions: list[dict] | None = None
+        
+        def get_sessions() -> list[dict]:
+            nonlocal all_sessions
+            if all_sessions is None:
+                all_sessions = extract_work_from_sessions(config.cass_path, since, now)
+            return all_sessions
+        
         worklog = None
         if config.worklog_enabled:
             task = progress.add_task("Generating work log...", total=None)
-            all_sessions = extract_work_from_sessions(config.cass_path, since, now)
             worklog = generate_worklog(
-                all_sessions,
+                get_sessions(),
                 config.extra_dirs,
                 config.extra_patterns,
                 since,
@@ -1396,16 +2238,14 @@ def run_pipeline(args: argparse.Namespace) -> int:
         
         if not dry_run:
             console.print("[blue]Pushing to SQLite...[/blue]")
-            if not config.worklog_enabled:
-                all_sessions = extract_work_from_sessions(config.cass_path, since, now)
             push_to_sqlite(
                 results,
                 worklog,
-                all_sessions,
+                get_sessions(),
             )
         
         task = progress.add_task("Calculating trends...", total=None)
-        historical = load_historical_data(config.output_dir, config.trend_window)
+        historical = load_historical_data(config.output_dir, config.trend_window, not args.no_cache)
         trends = calculate_trends(results, historical)
         progress.remove_task(task)
         
@@ -1420,23 +2260,25 @@ def run_pipeline(args: argparse.Namespace) -> int:
         
         task = progress.add_task("Generating reports...", total=None)
         
-        json_report = generate_json_report(results, trends, metadata, worklog)
         md_report = generate_markdown_report(results, trends, metadata, worklog)
         
         json_path = config.output_dir / f"daily-report-{today}.json"
+        counts_path = config.output_dir / f"daily-report-{today}.counts.json"
         md_path = config.output_dir / f"daily-report-{today}.md"
         
-        with open(json_path, "w") as f:
-            json.dump(json_report, f, indent=2)
+        worklog_path = config.output_dir / f"daily-worklog-{today}.md"
         
-        with open(md_path, "w") as f:
-            f.write(md_report)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(write_json_report, json_path, iter_json_report(results, trends, metadata, worklog)),
+                executor.submit(counts_path.write_bytes, json_dumpb({name: len(r.anti_patterns) for name, r in results.items()})),
+                executor.submit(md_path.write_text, md_report),
+            ]
+            if worklog:
+                futures.append(executor.submit(worklog_path.write_text, generate_worklog_markdown(worklog)))
         
-        if worklog:
-            worklog_md = generate_worklog_markdown(worklog)
-            worklog_path = config.output_dir / f"daily-worklog-{today}.md"
-            with open(worklog_path, "w") as f:
-                f.write(worklog_md)
+        for future in futures:
+            future.result()
         
         progress.remove_task(task)
         
@@ -1447,7 +2289,7 @@ def run_pipeline(args: argparse.Namespace) -> int:
     console.print(f"  JSON: {json_path}")
     console.print(f"  Markdown: {md_path}")
     if worklog:
-        console.print(f"  Work Log: {config.output_dir / f'daily-worklog-{today}.md'}")
+        console.print(f"  Work Log: {worklog_path}")
     
     total_anti = sum(len(r.anti_patterns) for r in results.values())
     total_wins = sum(len(r.wins) for r in results.values())
@@ -1489,19 +2331,28 @@ def main() -> int:
         action="store_true",
         help="Force reindex before analysis",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached history and LLM responses and always re-run analysis",
+    )
     
     args = parser.parse_args()
+    config = None
     
     try:
-        return run_pipeline(args)
+        config = Config.from_toml(Path(args.config).expanduser())
+        return run_pipeline(args, config)
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted[/yellow]")
         return 130
     except Exception as e:
         console.print(f"[red]Fatal error: {e}[/red]")
-        config = Config.from_toml(Path(args.config).expanduser())
-        send_failure_email(str(e), config)
+        if config is not None:
+            send_failure_email(str(e), config)
         return 1
+    finally:
+        close_http_client()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+
+class PruneLlmCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config = main.Config(output_dir=Path(self.tmp.name), trend_window=7)
+        self.cache_dir = self.config.output_dir / ".llm-cache"
+        self.cache_dir.mkdir()
+    
+    def write_entry(self, name: str, age_days: float) -> Path:
+        path = self.cache_dir / name
+        path.write_text("{}")
+        mtime = time.time() - age_days * 86_400
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_removes_entries_older_than_trend_window(self):
+        old = self.write_entry("old.json", 8)
+        fresh = self.write_entry("fresh.json", 1)
+        other = self.write_entry("notes.txt", 30)
+        
+        self.assertEqual(main.prune_llm_cache(self.config), 1)
+        self.assertFalse(old.exists())
+        self.assertTrue(fresh.exists())
+        self.assertTrue(other.exists())
+    
+    def test_fresh_entry_survives_a_save_and_prune(self):
+        cache_path = main.llm_cache_path(self.config, "prompt")
+        main.save_llm_cache(cache_path, {"summary": "ok"})
+        
+        self.assertEqual(main.prune_llm_cache(self.config), 0)
+        self.assertEqual(main.load_llm_cache(cache_path), {"summary": "ok"})
+    
+    def test_missing_cache_dir_is_ignored(self):
+        self.cache_dir.rmdir()
+        self.assertEqual(main.prune_llm_cache(self.config), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()